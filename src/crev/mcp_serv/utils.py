@@ -1,12 +1,27 @@
 """Utility functions for the MCP server."""
 
-import json
+import fnmatch
+import os
 from pathlib import Path
 from typing import Any
 
+from crev.utils import jsonio
+
+
+def get_configs_path() -> Path:
+    """Get the configs.json path.
+
+    Reads CREV_CONFIG_PATH if set, otherwise uses configs.json in the
+    current directory.
+
+    Returns:
+        Path to the configs.json file
+    """
+    return Path(os.environ.get("CREV_CONFIG_PATH", "configs.json"))
+
 
 def load_configs() -> dict:
-    """Load configs.json from current directory.
+    """Load configs.json from the configured location.
 
     Returns:
         Configuration dictionary
@@ -14,22 +29,25 @@ def load_configs() -> dict:
     Raises:
         FileNotFoundError: If configs.json doesn't exist
     """
-    configs_file = Path("configs.json")
-    if not configs_file.exists():
+    configs_file = get_configs_path()
+    try:
+        data = configs_file.read_bytes()
+    except FileNotFoundError:
         raise FileNotFoundError(
             "configs.json not found. Run 'crev init' first to create a workspace."
-        )
-    with open(configs_file) as f:
-        return json.load(f)
+        ) from None
+    return jsonio.loads(data)
 
 
 def get_data_dir() -> Path:
     """Get the data directory path.
 
+    Reads CREV_DATA_DIR if set, otherwise uses data in the current directory.
+
     Returns:
         Path to the data directory
     """
-    return Path("data")
+    return Path(os.environ.get("CREV_DATA_DIR", "data"))
 
 
 def find_repo_summary(org: str, repo_name: str) -> str | None:
@@ -88,6 +106,59 @@ def _try_parse_int(s: str) -> int | None:
         return None
 
 
+def _scan_subdirs(path: str | Path) -> list[os.DirEntry]:
+    """List the subdirectories of a directory in a single scandir pass.
+
+    DirEntry.is_dir() uses the file type reported by the directory listing,
+    so no extra stat call is needed per entry.
+
+    Args:
+        path: Directory to scan
+
+    Returns:
+        Entries for each subdirectory, or an empty list if path doesn't exist
+    """
+    try:
+        with os.scandir(path) as entries:
+            return [entry for entry in entries if entry.is_dir()]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+def _find_first_file(path: str | Path, pattern: str) -> str | None:
+    """Find the name of the first entry in a directory matching a glob pattern.
+
+    Args:
+        path: Directory to scan
+        pattern: fnmatch-style pattern to match entry names against
+
+    Returns:
+        Name of the first matching entry, or None if there is none
+    """
+    try:
+        with os.scandir(path) as entries:
+            return next(
+                (e.name for e in entries if fnmatch.fnmatchcase(e.name, pattern)),
+                None,
+            )
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _find_pr_summary_file(pr_dir: str | Path, pr_number: int) -> str | None:
+    """Find the name of the summary file in a PR directory.
+
+    Args:
+        pr_dir: PR directory to check
+        pr_number: Pull request number the directory belongs to
+
+    Returns:
+        Name of the PR summary file, or None if it doesn't exist
+    """
+    file_name = f"sum.pr.{pr_number}.ai.md"
+    return file_name if Path(pr_dir, file_name).exists() else None
+
+
 def list_available_summaries() -> dict[str, Any]:
     """List all available summaries in the data directory.
 
@@ -95,38 +166,35 @@ def list_available_summaries() -> dict[str, Any]:
         Dictionary with repo_summaries and pr_summaries lists
     """
     data_dir = get_data_dir()
-    if not data_dir.exists():
-        return {"repo_summaries": [], "pr_summaries": []}
-
-    # Get all org/repo directory pairs
-    repo_dirs = [
-        (org_dir.name, repo_dir)
-        for org_dir in data_dir.iterdir()
-        if org_dir.is_dir()
-        for repo_dir in org_dir.iterdir()
-        if repo_dir.is_dir()
+
+    # Get all org/repo directory pairs, scanning each repo's subdirectories once
+    repos = [
+        (org_dir.name, repo_dir.name, _scan_subdirs(repo_dir.path))
+        for org_dir in _scan_subdirs(data_dir)
+        for repo_dir in _scan_subdirs(org_dir.path)
     ]
 
     # Find repo summaries (first matching file per repo)
     repo_summaries = [
-        {"org": org, "repo": repo_dir.name, "file": file.name}
-        for org, repo_dir in repo_dirs
-        if (file := next((repo_dir / "sum").glob("sum.repo.*.ai.md"), None))
+        {"org": org, "repo": repo, "file": file_name}
+        for org, repo, subdirs in repos
+        for sum_dir in subdirs
+        if sum_dir.name == "sum"
+        and (file_name := _find_first_file(sum_dir.path, "sum.repo.*.ai.md"))
     ]
 
     # Find PR summaries (numeric directories with summary files)
     pr_summaries = [
         {
             "org": org,
-            "repo": repo_dir.name,
+            "repo": repo,
             "pr_number": pr_number,
-            "file": summary_file.name,
+            "file": file_name,
         }
-        for org, repo_dir in repo_dirs
-        for pr_dir in repo_dir.iterdir()
-        if pr_dir.is_dir()
-        and (pr_number := _try_parse_int(pr_dir.name)) is not None
-        and (summary_file := pr_dir / f"sum.pr.{pr_number}.ai.md").exists()
+        for org, repo, subdirs in repos
+        for pr_dir in subdirs
+        if (pr_number := _try_parse_int(pr_dir.name)) is not None
+        and (file_name := _find_pr_summary_file(pr_dir.path, pr_number))
     ]
 
     return {"repo_summaries": repo_summaries, "pr_summaries": pr_summaries}
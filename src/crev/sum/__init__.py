@@ -42,12 +42,21 @@ def sum(ctx: click.Context, context_only: bool = False) -> None:
     is_flag=True,
     help="Only collect and cache repo context without generating summary",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of repositories to summarize concurrently",
+)
 @click.pass_context
 def repo(
     ctx: click.Context,
     org: Optional[str] = None,
     repo_name: Optional[str] = None,
     context_only: bool = False,
+    jobs: int = 1,
 ) -> None:
     """Summarize repository business purpose, tech stack, and architecture.
 
@@ -67,12 +76,14 @@ def repo(
     Skips repositories that already have summary files.
 
     Use --context-only to collect context without generating summaries.
+
+    Use --jobs N to summarize up to N repositories at once.
     """
     # Inherit context_only from parent if not explicitly set
     if not context_only and ctx.obj:
         context_only = ctx.obj.get("context_only", False)
 
-    execute_sum_repo(org, repo_name, context_only)
+    execute_sum_repo(org, repo_name, context_only, jobs)
 
 
 @sum.command()
@@ -2,12 +2,14 @@
 
 import json
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, Optional
 
 import click
 
-from crev.utils import cache_file_check
+from crev.utils import cache_file_check, jsonio
 from crev.utils.ai.llm import get_llm_client
 from crev.utils.context.collector import file_category as collect_file_category
 from crev.utils.context.collector.repo import repo as collect_repo_context
@@ -197,7 +199,7 @@ def _phase1_categorize_files(
             "infra_result",
             "output",
         ],
-        parser=json.loads,
+        parser=jsonio.loads,
         format_args=format_args,
     )
 
@@ -615,10 +617,60 @@ def summarize_repo(
     )
 
 
+def _summarize_repos_concurrently(
+    targets: list[tuple[str, str]],
+    jobs: int,
+    config: dict,
+    cache_files_config: dict,
+    llm: Optional[Any],
+    context_only: bool,
+) -> None:
+    """Summarize repositories on a thread pool, stopping at the first failure.
+
+    As in the serial loop, an exception from one repo (an LLM error, a
+    SystemExit for a missing prompt, Ctrl-C) stops the run: repos that have
+    not started yet are skipped, and only repos already in progress finish.
+
+    Args:
+        targets: (repo_name, org) pairs to summarize
+        jobs: Maximum number of repositories to summarize at once
+        config: Configuration dictionary
+        cache_files_config: Cache file name configuration from configs.json
+        llm: Optional LLM client instance (required if not context_only)
+        context_only: If True, only collect context and skip LLM generation
+    """
+    failed = threading.Event()
+
+    def run(name: str, repo_org: str) -> None:
+        # A worker can dequeue the next repo before the main thread sees the
+        # failure, so check here as well as cancelling queued futures
+        if failed.is_set():
+            return
+        try:
+            summarize_repo(
+                name, repo_org, config, cache_files_config, llm, context_only
+            )
+        except BaseException:
+            failed.set()
+            raise
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(run, name, repo_org) for name, repo_org in targets]
+        try:
+            # Re-raise the first worker exception as soon as it happens
+            for future in as_completed(futures):
+                future.result()
+        except BaseException:
+            failed.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+
 def sum_repo(
     org: Optional[str] = None,
     repo_name: Optional[str] = None,
     context_only: bool = False,
+    jobs: int = 1,
 ) -> None:
     """Execute repo summarization.
 
@@ -626,6 +678,10 @@ def sum_repo(
         org: Optional org name. Use "." to match all orgs. If None, processes all orgs.
         repo_name: Optional specific repo name. Use "." to match all repos. If None, processes all repos.
         context_only: If True, only collect context and skip LLM generation
+        jobs: Number of repositories to summarize concurrently. Repos are
+            independent, so with jobs > 1 their LLM calls overlap instead of
+            running back to back; progress output from different repos may
+            interleave.
     """
     # Load config
     config = load_configs()
@@ -639,14 +695,25 @@ def sum_repo(
     # Get LLM client once if not in context_only mode
     llm = None if context_only else get_llm_client()
 
-    # Process each repo
+    # Collect valid repo entries
+    targets: list[tuple[str, str]] = []
     for repo in repos:
         name = repo.get("name")
         repo_org = repo.get("org")
         if not name or not repo_org:
             click.echo("Skipping invalid repo entry (missing name or org)", err=True)
             continue
+        targets.append((name, repo_org))
 
-        summarize_repo(name, repo_org, config, cache_files_config, llm, context_only)
+    # Process each repo
+    if jobs > 1 and len(targets) > 1:
+        _summarize_repos_concurrently(
+            targets, jobs, config, cache_files_config, llm, context_only
+        )
+    else:
+        for name, repo_org in targets:
+            summarize_repo(
+                name, repo_org, config, cache_files_config, llm, context_only
+            )
 
     click.echo("Done.")
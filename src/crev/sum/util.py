@@ -6,6 +6,8 @@ from typing import Any, Optional
 
 import click
 
+from crev.utils import read_cached
+
 
 def load_configs() -> dict:
     """Load configs.json from the current directory.
@@ -81,6 +83,9 @@ def get_repos_from_config(
 def load_prompt_file(prompt_path: str) -> str:
     """Load a prompt from a file.
 
+    Prompts are re-read only when the file's mtime or size changes, so
+    repos processed in one run share a single read of each prompt.
+
     Args:
         prompt_path: Path to the prompt file
 
@@ -90,13 +95,13 @@ def load_prompt_file(prompt_path: str) -> str:
     Raises:
         SystemExit: If prompt file is not found
     """
-    prompt_file = Path(prompt_path)
-
-    if not prompt_file.exists():
+    try:
+        data = read_cached(prompt_path)
+    except FileNotFoundError:
         click.echo(f"Error: Prompt file '{prompt_path}' not found.", err=True)
-        raise SystemExit(1)
+        raise SystemExit(1) from None
 
-    return prompt_file.read_text()
+    return data.decode()
 
 
 def ensure_directory_exists(directory: Path) -> None:
@@ -1,5 +1,6 @@
 """Utilities for crev."""
 
-from crev.utils.cache import cache_file_check
+from crev.utils import jsonio
+from crev.utils.cache import cache_file_check, read_cached
 
-__all__ = ["cache_file_check"]
+__all__ = ["cache_file_check", "jsonio", "read_cached"]
@@ -1,5 +1,7 @@
 """Cache utilities for crev."""
 
+import functools
+import os
 from pathlib import Path
 from typing import Callable, Optional, TypeVar
 
@@ -8,6 +10,37 @@ import click
 T = TypeVar("T")
 
 
+@functools.lru_cache(maxsize=32)
+def _read_bytes_cached(path: str, mtime_ns: int, size: int) -> bytes:
+    """Read a file, memoized on its path and stat signature.
+
+    Args:
+        path: Absolute path to the file
+        mtime_ns: File modification time in nanoseconds (part of the cache key)
+        size: File size in bytes (part of the cache key)
+
+    Returns:
+        Contents of the file
+    """
+    return Path(path).read_bytes()
+
+
+def read_cached(path: str | Path) -> bytes:
+    """Read a file, reusing the last read until its mtime or size changes.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        Contents of the file
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    stat = os.stat(path)
+    return _read_bytes_cached(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
 def cache_file_check(
     output_dir: Path,
     cache_files_config: dict,
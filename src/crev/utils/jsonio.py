@@ -0,0 +1,33 @@
+"""JSON parsing helpers for crev."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is optional (pip install crev[fast])
+    orjson = None
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document, using orjson when it is installed.
+
+    Args:
+        data: JSON document as text or UTF-8 bytes
+
+    Returns:
+        Parsed JSON value
+    """
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize a value to compact JSON bytes, using orjson when it is installed.
+
+    Args:
+        obj: JSON-serializable value
+
+    Returns:
+        UTF-8 encoded JSON document
+    """
+    return orjson.dumps(obj) if orjson else json.dumps(obj).encode()
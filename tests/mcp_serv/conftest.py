@@ -0,0 +1,95 @@
+"""Shared fixtures for the mcp-serv tests."""
+
+import json
+
+import pytest
+
+from crev.mcp_serv.server import create_server
+
+CONFIG_DATA = {
+    "repos": [
+        {"org": "test-org", "name": "repo1", "pull_requests": [1, 2, 3]},
+        {"org": "test-org", "name": "repo2", "pull_requests": [10]},
+        {"org": "other-org", "name": "repo3", "pull_requests": [100]},
+    ]
+}
+
+# Summary files in the shared workspace, as (relative path, content) pairs
+SUMMARY_FILES = [
+    (
+        "data/test-org/repo1/sum/sum.repo.repo1.ai.md",
+        "# repo1 Summary\nThis is the summary for test-org/repo1.",
+    ),
+    (
+        "data/test-org/repo2/sum/sum.repo.repo2.ai.md",
+        "# repo2 Summary\nThis is the summary for test-org/repo2.",
+    ),
+    (
+        "data/test-org/repo1/1/sum.pr.1.ai.md",
+        "# PR #1 Summary\nChanges for test-org/repo1#1.",
+    ),
+    (
+        "data/test-org/repo1/2/sum.pr.2.ai.md",
+        "# PR #2 Summary\nChanges for test-org/repo1#2.",
+    ),
+    (
+        "data/test-org/repo2/10/sum.pr.10.ai.md",
+        "# PR #10 Summary\nChanges for test-org/repo2#10.",
+    ),
+]
+
+
+def point_crev_at(monkeypatch, root):
+    """Point the data dir and configs.json lookups at a workspace root."""
+    monkeypatch.setenv("CREV_DATA_DIR", str(root / "data"))
+    monkeypatch.setenv("CREV_CONFIG_PATH", str(root / "configs.json"))
+
+
+@pytest.fixture(autouse=True)
+def crev_env(tmp_path, monkeypatch):
+    """Point the data dir and configs.json lookups at an empty tmp_path."""
+    point_crev_at(monkeypatch, tmp_path)
+    return tmp_path
+
+
+@pytest.fixture(scope="session")
+def mcp_server():
+    """Create and return an MCP server instance."""
+    return create_server()
+
+
+@pytest.fixture(scope="session")
+def tools_by_name(mcp_server):
+    """Map each registered tool name to its tool object."""
+    return {tool.name: tool for tool in mcp_server._tool_manager._tools.values()}
+
+
+@pytest.fixture
+def setup_configs(tmp_path):
+    """Set up a configs.json file in the tmp directory."""
+    (tmp_path / "configs.json").write_text(json.dumps(CONFIG_DATA))
+    return tmp_path
+
+
+@pytest.fixture(scope="session")
+def summaries_workspace(tmp_path_factory):
+    """Build the configs.json and summary tree once per session.
+
+    Tests must treat this tree as read-only.
+    """
+    root = tmp_path_factory.mktemp("summaries")
+    (root / "configs.json").write_text(json.dumps(CONFIG_DATA))
+
+    for rel_path, content in SUMMARY_FILES:
+        path = root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content.encode())
+
+    return root
+
+
+@pytest.fixture
+def setup_summaries(summaries_workspace, monkeypatch):
+    """Point the data dir and configs.json lookups at the shared summary tree."""
+    point_crev_at(monkeypatch, summaries_workspace)
+    return summaries_workspace
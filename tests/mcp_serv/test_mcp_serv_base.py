@@ -9,12 +9,20 @@ from crev.mcp_serv.server import create_server
 from crev.mcp_serv.utils import (
     find_pr_summary,
     find_repo_summary,
+    get_configs_path,
     get_data_dir,
     get_distinct_orgs,
     get_repos_for_org,
     list_available_summaries,
     load_configs,
 )
+from crev.utils import jsonio
+
+# Round-trip fixture for load_configs, pre-serialized in canonical key order
+CONFIG_DATA = {
+    "repos": [{"org": "test-org", "name": "test-repo", "pull_requests": [1, 2]}]
+}
+CONFIG_JSON = json.dumps(CONFIG_DATA, sort_keys=True)
 
 
 class TestCreateServer:
@@ -36,22 +44,41 @@ class TestCreateServer:
 class TestLoadConfigs:
     """Tests for the load_configs utility function."""
 
-    def test_load_configs_success(self, tmp_path, monkeypatch):
+    def test_load_configs_success(self, tmp_path):
         """Test loading configs.json successfully."""
-        monkeypatch.chdir(tmp_path)
+        (tmp_path / "configs.json").write_text(CONFIG_JSON)
 
-        config_data = {
-            "repos": [{"org": "test-org", "name": "test-repo", "pull_requests": [1, 2]}]
-        }
-        (tmp_path / "configs.json").write_text(json.dumps(config_data))
+        result = load_configs()
+        assert json.dumps(result, sort_keys=True) == CONFIG_JSON
+
+    def test_load_configs_without_orjson(self, tmp_path, monkeypatch):
+        """Test that load_configs falls back to the stdlib json parser."""
+        monkeypatch.setattr(jsonio, "orjson", None)
+        (tmp_path / "configs.json").write_text(CONFIG_JSON)
 
         result = load_configs()
-        assert result == config_data
+        assert json.dumps(result, sort_keys=True) == CONFIG_JSON
 
-    def test_load_configs_file_not_found(self, tmp_path, monkeypatch):
-        """Test that load_configs raises FileNotFoundError when file doesn't exist."""
-        monkeypatch.chdir(tmp_path)
+    def test_load_configs_rereads_modified_file(self, tmp_path):
+        """Test that load_configs picks up changes to configs.json."""
+        configs_file = tmp_path / "configs.json"
+        configs_file.write_text(CONFIG_JSON)
+        assert load_configs() == CONFIG_DATA
+
+        configs_file.write_text(json.dumps({"repos": []}))
+
+        assert load_configs() == {"repos": []}
+
+    def test_load_configs_returns_independent_copies(self, tmp_path):
+        """Test that mutating one load_configs result doesn't affect the next."""
+        (tmp_path / "configs.json").write_text(CONFIG_JSON)
+
+        load_configs()["repos"][0]["name"] = "mutated"
+
+        assert load_configs() == CONFIG_DATA
 
+    def test_load_configs_file_not_found(self):
+        """Test that load_configs raises FileNotFoundError when file doesn't exist."""
         with pytest.raises(FileNotFoundError) as exc_info:
             load_configs()
 
@@ -62,136 +89,135 @@ class TestLoadConfigs:
 class TestGetDataDir:
     """Tests for the get_data_dir utility function."""
 
-    def test_get_data_dir_returns_path(self):
-        """Test that get_data_dir returns the data directory path."""
+    def test_get_data_dir_returns_path(self, monkeypatch):
+        """Test that get_data_dir defaults to the data directory path."""
+        monkeypatch.delenv("CREV_DATA_DIR")
+
         result = get_data_dir()
         assert result == Path("data")
 
+    def test_get_data_dir_from_env(self, tmp_path):
+        """Test that get_data_dir honors CREV_DATA_DIR."""
+        result = get_data_dir()
+        assert result == tmp_path / "data"
 
-class TestFindRepoSummary:
-    """Tests for the find_repo_summary utility function."""
 
-    def test_find_repo_summary_with_md_file(self, tmp_path, monkeypatch):
-        """Test finding a repo summary with .md file."""
-        monkeypatch.chdir(tmp_path)
+class TestGetConfigsPath:
+    """Tests for the get_configs_path utility function."""
 
-        # Create directory structure
-        sum_dir = tmp_path / "data" / "test-org" / "test-repo" / "sum"
-        sum_dir.mkdir(parents=True)
-        summary_content = "# Repository Summary\nThis is a test summary."
-        (sum_dir / "sum.repo.test-repo.ai.md").write_text(summary_content)
+    def test_get_configs_path_returns_path(self, monkeypatch):
+        """Test that get_configs_path defaults to configs.json."""
+        monkeypatch.delenv("CREV_CONFIG_PATH")
 
-        result = find_repo_summary("test-org", "test-repo")
-        assert result == summary_content
+        result = get_configs_path()
+        assert result == Path("configs.json")
 
-    def test_find_repo_summary_with_json_file(self, tmp_path, monkeypatch):
-        """Test finding a repo summary with .json file (fallback)."""
-        monkeypatch.chdir(tmp_path)
+    def test_get_configs_path_from_env(self, tmp_path):
+        """Test that get_configs_path honors CREV_CONFIG_PATH."""
+        result = get_configs_path()
+        assert result == tmp_path / "configs.json"
 
-        # Create directory structure
-        sum_dir = tmp_path / "data" / "test-org" / "test-repo" / "sum"
-        sum_dir.mkdir(parents=True)
-        summary_content = '{"summary": "test"}'
-        (sum_dir / "sum.repo.test-repo.ai.json").write_text(summary_content)
 
-        result = find_repo_summary("test-org", "test-repo")
-        assert result == summary_content
+REPO_SUMMARY_MD = "# Repository Summary\nThis is a test summary."
+PR_SUMMARY_MD = "# PR Summary\nThis PR adds a feature."
 
-    def test_find_repo_summary_not_found(self, tmp_path, monkeypatch):
-        """Test finding a repo summary when directory doesn't exist."""
-        monkeypatch.chdir(tmp_path)
 
-        result = find_repo_summary("nonexistent-org", "nonexistent-repo")
-        assert result is None
+def make_dir_with_files(directory, files):
+    """Create a directory and write the given {filename: content} files into it.
 
-    def test_find_repo_summary_no_summary_file(self, tmp_path, monkeypatch):
-        """Test finding a repo summary when sum dir exists but no file."""
-        monkeypatch.chdir(tmp_path)
+    Passing None for files leaves the directory uncreated.
+    """
+    if files is None:
+        return
+    directory.mkdir(parents=True)
+    for name, content in files.items():
+        (directory / name).write_text(content)
 
+
+class TestFindRepoSummary:
+    """Tests for the find_repo_summary utility function."""
+
+    @pytest.mark.parametrize(
+        "files,expected",
+        [
+            pytest.param(
+                {"sum.repo.test-repo.ai.md": REPO_SUMMARY_MD},
+                REPO_SUMMARY_MD,
+                id="md_file",
+            ),
+            pytest.param(
+                {"sum.repo.test-repo.ai.json": '{"summary": "test"}'},
+                '{"summary": "test"}',
+                id="json_file_fallback",
+            ),
+            pytest.param(None, None, id="not_found"),
+            pytest.param({}, None, id="no_summary_file"),
+        ],
+    )
+    def test_find_repo_summary(self, tmp_path, files, expected):
+        """Test finding a repo summary for each sum directory layout."""
         sum_dir = tmp_path / "data" / "test-org" / "test-repo" / "sum"
-        sum_dir.mkdir(parents=True)
+        make_dir_with_files(sum_dir, files)
 
         result = find_repo_summary("test-org", "test-repo")
-        assert result is None
+        assert result == expected
 
 
 class TestFindPrSummary:
     """Tests for the find_pr_summary utility function."""
 
-    def test_find_pr_summary_success(self, tmp_path, monkeypatch):
-        """Test finding a PR summary successfully."""
-        monkeypatch.chdir(tmp_path)
-
-        # Create directory structure
+    @pytest.mark.parametrize(
+        "files,expected",
+        [
+            pytest.param(
+                {"sum.pr.123.ai.md": PR_SUMMARY_MD},
+                PR_SUMMARY_MD,
+                id="success",
+            ),
+            pytest.param(None, None, id="not_found"),
+            pytest.param({}, None, id="no_file"),
+        ],
+    )
+    def test_find_pr_summary(self, tmp_path, files, expected):
+        """Test finding a PR summary for each PR directory layout."""
         pr_dir = tmp_path / "data" / "test-org" / "test-repo" / "123"
-        pr_dir.mkdir(parents=True)
-        summary_content = "# PR Summary\nThis PR adds a feature."
-        (pr_dir / "sum.pr.123.ai.md").write_text(summary_content)
+        make_dir_with_files(pr_dir, files)
 
         result = find_pr_summary("test-org", "test-repo", 123)
-        assert result == summary_content
-
-    def test_find_pr_summary_not_found(self, tmp_path, monkeypatch):
-        """Test finding a PR summary when directory doesn't exist."""
-        monkeypatch.chdir(tmp_path)
-
-        result = find_pr_summary("nonexistent-org", "nonexistent-repo", 999)
-        assert result is None
-
-    def test_find_pr_summary_no_file(self, tmp_path, monkeypatch):
-        """Test finding a PR summary when directory exists but no file."""
-        monkeypatch.chdir(tmp_path)
-
-        pr_dir = tmp_path / "data" / "test-org" / "test-repo" / "123"
-        pr_dir.mkdir(parents=True)
-
-        result = find_pr_summary("test-org", "test-repo", 123)
-        assert result is None
+        assert result == expected
 
 
 class TestListAvailableSummaries:
     """Tests for the list_available_summaries utility function."""
 
-    def test_list_available_summaries_empty(self, tmp_path, monkeypatch):
+    def test_list_available_summaries_empty(self):
         """Test listing summaries when data dir doesn't exist."""
-        monkeypatch.chdir(tmp_path)
-
         result = list_available_summaries()
         assert result == {"repo_summaries": [], "pr_summaries": []}
 
-    def test_list_available_summaries_with_data(self, tmp_path, monkeypatch):
+    def test_list_available_summaries_with_data(self, setup_summaries):
         """Test listing summaries with existing data."""
-        monkeypatch.chdir(tmp_path)
-
-        # Create repo summary
-        sum_dir = tmp_path / "data" / "org1" / "repo1" / "sum"
-        sum_dir.mkdir(parents=True)
-        (sum_dir / "sum.repo.repo1.ai.md").write_text("# Repo summary")
-
-        # Create PR summary
-        pr_dir = tmp_path / "data" / "org1" / "repo1" / "42"
-        pr_dir.mkdir(parents=True)
-        (pr_dir / "sum.pr.42.ai.md").write_text("# PR summary")
-
         result = list_available_summaries()
 
-        assert len(result["repo_summaries"]) == 1
-        assert result["repo_summaries"][0]["org"] == "org1"
-        assert result["repo_summaries"][0]["repo"] == "repo1"
-
-        assert len(result["pr_summaries"]) == 1
-        assert result["pr_summaries"][0]["org"] == "org1"
-        assert result["pr_summaries"][0]["repo"] == "repo1"
-        assert result["pr_summaries"][0]["pr_number"] == 42
+        # Directory listing order is filesystem-dependent, so compare as sets
+        assert {(s["org"], s["repo"]) for s in result["repo_summaries"]} == {
+            ("test-org", "repo1"),
+            ("test-org", "repo2"),
+        }
+        assert {
+            (s["org"], s["repo"], s["pr_number"]) for s in result["pr_summaries"]
+        } == {
+            ("test-org", "repo1", 1),
+            ("test-org", "repo1", 2),
+            ("test-org", "repo2", 10),
+        }
 
 
 class TestGetDistinctOrgs:
     """Tests for the get_distinct_orgs utility function."""
 
-    def test_get_distinct_orgs_success(self, tmp_path, monkeypatch):
+    def test_get_distinct_orgs_success(self, tmp_path):
         """Test getting distinct orgs from configs."""
-        monkeypatch.chdir(tmp_path)
-
         config_data = {
             "repos": [
                 {"org": "org-b", "name": "repo1"},
@@ -204,10 +230,8 @@ class TestGetDistinctOrgs:
         result = get_distinct_orgs()
         assert result == ["org-a", "org-b"]  # Sorted and deduplicated
 
-    def test_get_distinct_orgs_no_config(self, tmp_path, monkeypatch):
+    def test_get_distinct_orgs_no_config(self):
         """Test getting orgs when configs.json doesn't exist."""
-        monkeypatch.chdir(tmp_path)
-
         result = get_distinct_orgs()
         assert result == []
 
@@ -215,10 +239,8 @@ class TestGetDistinctOrgs:
 class TestGetReposForOrg:
     """Tests for the get_repos_for_org utility function."""
 
-    def test_get_repos_for_org_success(self, tmp_path, monkeypatch):
+    def test_get_repos_for_org_success(self, tmp_path):
         """Test getting repos for a specific org."""
-        monkeypatch.chdir(tmp_path)
-
         config_data = {
             "repos": [
                 {"org": "org1", "name": "repo1", "pull_requests": [1]},
@@ -233,19 +255,15 @@ class TestGetReposForOrg:
         assert result[0]["name"] == "repo1"
         assert result[1]["name"] == "repo3"
 
-    def test_get_repos_for_org_not_found(self, tmp_path, monkeypatch):
+    def test_get_repos_for_org_not_found(self, tmp_path):
         """Test getting repos for a non-existent org."""
-        monkeypatch.chdir(tmp_path)
-
         config_data = {"repos": [{"org": "org1", "name": "repo1"}]}
         (tmp_path / "configs.json").write_text(json.dumps(config_data))
 
         result = get_repos_for_org("nonexistent")
         assert result == []
 
-    def test_get_repos_for_org_no_config(self, tmp_path, monkeypatch):
+    def test_get_repos_for_org_no_config(self):
         """Test getting repos when configs.json doesn't exist."""
-        monkeypatch.chdir(tmp_path)
-
         result = get_repos_for_org("any-org")
         assert result == []
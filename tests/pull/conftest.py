@@ -0,0 +1,33 @@
+"""Shared fixtures for the pull command tests."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+
+@pytest.fixture(scope="module")
+def runner():
+    """Create a CliRunner shared by the tests in a module."""
+    return CliRunner()
+
+
+@pytest.fixture
+def make_configs(tmp_path, monkeypatch):
+    """Change into tmp_path and return a helper that writes configs.json.
+
+    The helper writes {"repos": repos}, or the raw configs.json text given
+    with raw= (e.g. a pre-serialized document or one without a repos key),
+    pre-creates the optional existing repo directories, and returns
+    tmp_path.
+    """
+    monkeypatch.chdir(tmp_path)
+
+    def _write(repos=(), existing=(), *, raw=None):
+        text = raw if raw is not None else json.dumps({"repos": list(repos)})
+        (tmp_path / "configs.json").write_text(text)
+        for repo_dir in existing:
+            (tmp_path / repo_dir).mkdir(parents=True, exist_ok=True)
+        return tmp_path
+
+    return _write
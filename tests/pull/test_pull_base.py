@@ -1,147 +1,26 @@
 """Base tests for the pull command - core functionality."""
 
 import json
-from copy import deepcopy
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock
 
-from click.testing import CliRunner
+import pytest
 
 from crev import main
 
-# Load base configs data from JSON file
+# Load the base repo entry from the shared test configs
 _TEST_CONFIGS_PATH = Path(__file__).parent / "test.configs.json"
-with _TEST_CONFIGS_PATH.open() as _f:
-    BASE_configs = json.load(_f)
+BASE_REPO = json.loads(_TEST_CONFIGS_PATH.read_text())["repos"][0]
 
+TEST_REPO_PATH = Path("repos/test-org/test-repo")
 
-def test_pull_creates_repos_directory(tmp_path):
-    """Test that pull creates the repos directory if it doesn't exist."""
-    runner = CliRunner()
-
-    with runner.isolated_filesystem(temp_dir=tmp_path):
-        # Create minimal configs.json
-        configs = deepcopy(BASE_configs)
-        configs["repos"] = []
-        with open("configs.json", "w") as f:
-            json.dump(configs, f)
-
-        with patch("subprocess.run"):
-            result = runner.invoke(main, ["pull"])
-
-        assert result.exit_code == 0
-        assert Path("repos").exists()
-        assert Path("repos").is_dir()
-
-
-@patch("subprocess.run")
-def test_pull_clones_new_repo(mock_run, tmp_path):
-    """Test that pull clones a new repository."""
-    runner = CliRunner()
-
-    with runner.isolated_filesystem(temp_dir=tmp_path):
-        # Create configs.json with one repo
-        configs = deepcopy(BASE_configs)
-        configs["repos"][0]["pull_requests"] = []
-        with open("configs.json", "w") as f:
-            json.dump(configs, f)
-
-        result = runner.invoke(main, ["pull"])
-
-        assert result.exit_code == 0
-        assert "Cloning test-repo..." in result.output
-        assert "Done." in result.output
-
-        # Verify git clone was called with correct path including org
-        mock_run.assert_called_once()
-        call_args = mock_run.call_args[0][0]
-        assert call_args[0] == "git"
-        assert call_args[1] == "clone"
-        assert call_args[2] == "https://github.com/user/test-repo.git"
-        assert str(call_args[3]).endswith("repos/test-org/test-repo")
-
-
-@patch("subprocess.run")
-def test_pull_updates_existing_repo(mock_run, tmp_path):
-    """Test that pull updates an existing repository."""
-    runner = CliRunner()
-
-    with runner.isolated_filesystem(temp_dir=tmp_path):
-        # Create configs.json
-        configs = deepcopy(BASE_configs)
-        configs["repos"][0]["pull_requests"] = []
-        with open("configs.json", "w") as f:
-            json.dump(configs, f)
-
-        # Create existing repo directory with org level
-        Path("repos/test-org/test-repo").mkdir(parents=True)
-
-        result = runner.invoke(main, ["pull"])
-
-        assert result.exit_code == 0
-        assert "Pulling updates for test-repo..." in result.output
-        assert "Done." in result.output
-
-        # Verify git commands were called: 1 pull + 1 branch check
-        assert mock_run.call_count == 2
-        # First call should be git pull
-        assert mock_run.call_args_list[0][0][0] == ["git", "pull"]
-        assert mock_run.call_args_list[0][1]["cwd"] == Path("repos/test-org/test-repo")
-        # Second call should be git branch --list
-        assert mock_run.call_args_list[1][0][0] == ["git", "branch", "--list"]
-
-
-@patch("subprocess.run")
-def test_pull_fetches_pull_requests(mock_run, tmp_path):
-    """Test that pull fetches pull requests for a repo."""
-    runner = CliRunner()
-
-    with runner.isolated_filesystem(temp_dir=tmp_path):
-        # Create configs.json with PRs (uses base which has [123, 456])
-        configs = deepcopy(BASE_configs)
-        with open("configs.json", "w") as f:
-            json.dump(configs, f)
-
-        # Create existing repo directory with org level
-        Path("repos/test-org/test-repo").mkdir(parents=True)
-
-        result = runner.invoke(main, ["pull"])
-
-        assert result.exit_code == 0
-        assert "Pulling updates for test-repo..." in result.output
-        assert "Fetching PR #123 for test-repo into crev-pr-123..." in result.output
-        assert "Fetching PR #456 for test-repo into crev-pr-456..." in result.output
-        assert "Done." in result.output
-
-        # Verify git commands were called: 1 pull + 1 branch check + 2 fetch PRs
-        assert mock_run.call_count == 4
-
-        # Check PR fetch calls
-        pr_calls = [c for c in mock_run.call_args_list if "fetch" in c[0][0]]
-        assert len(pr_calls) == 2
-        assert pr_calls[0][0][0] == [
-            "git",
-            "fetch",
-            "origin",
-            "pull/123/head:crev-pr-123",
-        ]
-        assert pr_calls[1][0][0] == [
-            "git",
-            "fetch",
-            "origin",
-            "pull/456/head:crev-pr-456",
-        ]
-
-
-@patch("subprocess.run")
-def test_pull_handles_multiple_repos(mock_run, tmp_path):
-    """Test that pull handles multiple repositories."""
-    runner = CliRunner()
-
-    with runner.isolated_filesystem(temp_dir=tmp_path):
-        # Create configs.json with multiple repos
-        configs = deepcopy(BASE_configs)
-        configs["repos"] = [
+# Pre-serialized configs.json contents shared by several cases
+_SINGLE_REPO_NO_PRS = json.dumps({"repos": [{**BASE_REPO, "pull_requests": []}]})
+# Base repo has PRs [123, 456]
+_SINGLE_REPO_TWO_PRS = json.dumps({"repos": [BASE_REPO]})
+_MULTI_REPO = json.dumps(
+    {
+        "repos": [
             {
                 "org": "org1",
                 "name": "repo1",
@@ -155,76 +34,163 @@ def test_pull_handles_multiple_repos(mock_run, tmp_path):
                 "pull_requests": [789],
             },
         ]
-        with open("configs.json", "w") as f:
-            json.dump(configs, f)
-
-        # Create existing repo directory for repo2 with org level
-        Path("repos/org2/repo2").mkdir(parents=True)
+    }
+)
+
+
+def _run_with_existing_pr_branch(cmd, **kwargs):
+    """Mock subprocess.run where branch crev-pr-123 already exists locally."""
+    result = Mock()
+    if cmd == ["git", "branch", "--list"]:
+        result.stdout = "  crev-pr-123\n  main\n* master\n"
+    return result
+
+
+# Each case: configs.json contents, repo dirs to pre-create, subprocess.run
+# side effect, expected (command, cwd) calls, and expected output lines
+PULL_CASES = [
+    pytest.param(
+        _SINGLE_REPO_NO_PRS,
+        [],
+        None,
+        [
+            (
+                [
+                    "git",
+                    "clone",
+                    "https://github.com/user/test-repo.git",
+                    str(TEST_REPO_PATH),
+                ],
+                None,
+            ),
+        ],
+        ["Cloning test-repo...", "Done."],
+        id="clones_new_repo",
+    ),
+    pytest.param(
+        _SINGLE_REPO_NO_PRS,
+        [TEST_REPO_PATH],
+        None,
+        [
+            (["git", "pull"], TEST_REPO_PATH),
+            (["git", "branch", "--list"], TEST_REPO_PATH),
+        ],
+        ["Pulling updates for test-repo...", "Done."],
+        id="updates_existing_repo",
+    ),
+    pytest.param(
+        _SINGLE_REPO_TWO_PRS,
+        [TEST_REPO_PATH],
+        None,
+        [
+            (["git", "pull"], TEST_REPO_PATH),
+            (["git", "branch", "--list"], TEST_REPO_PATH),
+            (["git", "fetch", "origin", "pull/123/head:crev-pr-123"], TEST_REPO_PATH),
+            (["git", "fetch", "origin", "pull/456/head:crev-pr-456"], TEST_REPO_PATH),
+        ],
+        [
+            "Pulling updates for test-repo...",
+            "Fetching PR #123 for test-repo into crev-pr-123...",
+            "Fetching PR #456 for test-repo into crev-pr-456...",
+            "Done.",
+        ],
+        id="fetches_pull_requests",
+    ),
+    pytest.param(
+        _MULTI_REPO,
+        [Path("repos/org2/repo2")],
+        None,
+        [
+            (
+                [
+                    "git",
+                    "clone",
+                    "https://github.com/user/repo1.git",
+                    "repos/org1/repo1",
+                ],
+                None,
+            ),
+            (["git", "pull"], Path("repos/org2/repo2")),
+            (["git", "branch", "--list"], Path("repos/org2/repo2")),
+            (
+                ["git", "fetch", "origin", "pull/789/head:crev-pr-789"],
+                Path("repos/org2/repo2"),
+            ),
+        ],
+        [
+            "Cloning repo1...",
+            "Pulling updates for repo2...",
+            "Fetching PR #789 for repo2 into crev-pr-789...",
+        ],
+        id="handles_multiple_repos",
+    ),
+    pytest.param(
+        # crev-pr-123 already exists
+        _SINGLE_REPO_TWO_PRS,
+        [TEST_REPO_PATH],
+        _run_with_existing_pr_branch,
+        [
+            (["git", "pull"], TEST_REPO_PATH),
+            (["git", "branch", "--list"], TEST_REPO_PATH),
+            (["git", "fetch", "origin", "pull/456/head:crev-pr-456"], TEST_REPO_PATH),
+        ],
+        [
+            "Pulling updates for test-repo...",
+            "Branch crev-pr-123 already exists for test-repo, skipping...",
+            "Fetching PR #456 for test-repo into crev-pr-456...",
+            "Done.",
+        ],
+        id="skips_existing_pr_branches",
+    ),
+]
+
+
+class TestPull:
+    """Tests for the core pull flow with subprocess.run mocked out."""
+
+    @pytest.fixture(autouse=True)
+    def _patch_run(self, monkeypatch):
+        """Replace subprocess.run with a MagicMock for each test."""
+        self.mock_run = MagicMock()
+        monkeypatch.setattr("subprocess.run", self.mock_run)
+
+    def test_pull_creates_repos_directory(self, runner, make_configs):
+        """Test that pull creates the repos directory if it doesn't exist."""
+        make_configs([])
 
         result = runner.invoke(main, ["pull"])
 
         assert result.exit_code == 0
-        assert "Cloning repo1..." in result.output
-        assert "Pulling updates for repo2..." in result.output
-        assert "Fetching PR #789 for repo2 into crev-pr-789..." in result.output
-
-        # Verify git commands: 1 clone (repo1) + 1 pull (repo2) + 1 branch check + 1 fetch PR
-        assert mock_run.call_count == 4
-
-
-@patch("subprocess.run")
-def test_pull_skips_existing_pr_branches(mock_run, tmp_path):
-    """Test that pull skips fetching PRs when their branches already exist."""
-    runner = CliRunner()
-
-    with runner.isolated_filesystem(temp_dir=tmp_path):
-        # Create configs.json with PRs (uses base which has [123, 456])
-        configs = deepcopy(BASE_configs)
-        with open("configs.json", "w") as f:
-            json.dump(configs, f)
-
-        # Create existing repo directory with org level
-        Path("repos/test-org/test-repo").mkdir(parents=True)
-
-        # Mock subprocess.run to simulate branch check and git pull
-        def mock_subprocess_run(cmd, **kwargs):
-            result = Mock()
-            # Mock git branch --list to return existing branch crev-pr-123
-            if cmd == ["git", "branch", "--list"]:
-                result.stdout = "  crev-pr-123\n  main\n* master\n"
-                return result
-            # Mock git pull
-            if cmd == ["git", "pull"]:
-                return result
-            # Mock git fetch (should only be called for PR #456, not #123)
-            if "fetch" in cmd:
-                return result
-            return result
-
-        mock_run.side_effect = mock_subprocess_run
+        assert Path("repos").exists()
+        assert Path("repos").is_dir()
+
+    @pytest.mark.parametrize(
+        "configs,existing_dirs,side_effect,expected_calls,expected_output",
+        PULL_CASES,
+    )
+    def test_pull_scenarios(
+        self,
+        runner,
+        make_configs,
+        configs,
+        existing_dirs,
+        side_effect,
+        expected_calls,
+        expected_output,
+    ):
+        """Test that pull clones, updates and fetches PRs for each scenario."""
+        make_configs(existing=existing_dirs, raw=configs)
+
+        self.mock_run.side_effect = side_effect
 
         result = runner.invoke(main, ["pull"])
 
         assert result.exit_code == 0
-        assert "Pulling updates for test-repo..." in result.output
-        assert (
-            "Branch crev-pr-123 already exists for test-repo, skipping..."
-            in result.output
-        )
-        assert "Fetching PR #456 for test-repo into crev-pr-456..." in result.output
-        assert "Done." in result.output
-
-        # Verify git commands: 1 pull + 1 branch check + 1 fetch (only for PR #456)
-        assert mock_run.call_count == 3
-
-        # Verify that fetch was only called for PR #456, not #123
-        fetch_calls = [
-            c for c in mock_run.call_args_list if len(c[0]) > 0 and "fetch" in c[0][0]
-        ]
-        assert len(fetch_calls) == 1
-        assert fetch_calls[0][0][0] == [
-            "git",
-            "fetch",
-            "origin",
-            "pull/456/head:crev-pr-456",
+        for line in expected_output:
+            assert line in result.output
+
+        # Verify the git commands and the directory each one ran in
+        calls = [
+            (c.args[0], c.kwargs.get("cwd")) for c in self.mock_run.call_args_list
         ]
+        assert calls == expected_calls
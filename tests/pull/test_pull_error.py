@@ -2,40 +2,33 @@
 
 import json
 import subprocess
-from copy import deepcopy
 from pathlib import Path
 from unittest.mock import patch
 
-from click.testing import CliRunner
-
 from crev import main
 
-# Load base configs data from JSON file
+# Load the base repo entry from the shared test configs
 _TEST_CONFIGS_PATH = Path(__file__).parent / "test.configs.json"
-with _TEST_CONFIGS_PATH.open() as _f:
-    BASE_CONFIGS = json.load(_f)
+BASE_REPO = json.loads(_TEST_CONFIGS_PATH.read_text())["repos"][0]
+
+TEST_REPO_PATH = Path("repos/test-org/test-repo")
 
 
-def test_pull_fails_without_repos_json(tmp_path):
+def test_pull_fails_without_configs_json(runner, tmp_path, monkeypatch):
     """Test that pull fails when configs.json is not found."""
-    runner = CliRunner()
+    monkeypatch.chdir(tmp_path)
 
-    with runner.isolated_filesystem(temp_dir=tmp_path):
-        result = runner.invoke(main, ["pull"])
+    result = runner.invoke(main, ["pull"])
 
-        assert result.exit_code == 1
-        assert "configs.json not found" in result.output
-        assert "Run 'crev init' first" in result.output
+    assert result.exit_code == 1
+    assert "configs.json not found" in result.output
+    assert "Run 'crev init' first" in result.output
 
 
-def test_pull_skips_invalid_repo_entry(tmp_path):
+def test_pull_skips_invalid_repo_entry(runner, make_configs):
     """Test that pull skips repos with missing name, url, or org."""
-    runner = CliRunner()
-
-    with runner.isolated_filesystem(temp_dir=tmp_path):
-        # Create configs.json with invalid entries
-        configs = deepcopy(BASE_CONFIGS)
-        configs["repos"] = [
+    make_configs(
+        [
             {
                 "org": "valid-org",
                 "name": "valid-repo",
@@ -46,99 +39,76 @@ def test_pull_skips_invalid_repo_entry(tmp_path):
             {"name": "no-org", "url": "https://github.com/user/no-org.git"},
             {},
         ]
-        with open("configs.json", "w") as f:
-            json.dump(configs, f)
+    )
 
-        with patch("subprocess.run"):
-            result = runner.invoke(main, ["pull"])
+    with patch("subprocess.run"):
+        result = runner.invoke(main, ["pull"])
 
-        assert result.exit_code == 0
-        assert "Skipping invalid repo entry" in result.output
+    assert result.exit_code == 0
+    assert "Skipping invalid repo entry" in result.output
 
 
 @patch("subprocess.run")
-def test_pull_skips_prs_when_repo_not_found(mock_run, tmp_path):
+def test_pull_skips_prs_when_repo_not_found(mock_run, runner, make_configs):
     """Test that pull skips PRs when the repo directory doesn't exist."""
-    runner = CliRunner()
-
-    with runner.isolated_filesystem(temp_dir=tmp_path):
-        # Create configs.json
-        configs = deepcopy(BASE_CONFIGS)
-        configs["repos"][0]["pull_requests"] = [123]
-        with open("configs.json", "w") as f:
-            json.dump(configs, f)
+    make_configs([{**BASE_REPO, "pull_requests": [123]}])
 
-        # Simulate clone failure by not creating the directory
-        mock_run.side_effect = lambda *args, **kwargs: None
+    # Simulate clone failure by not creating the directory
+    mock_run.side_effect = lambda *args, **kwargs: None
 
-        result = runner.invoke(main, ["pull"])
+    result = runner.invoke(main, ["pull"])
 
-        assert result.exit_code == 0
-        assert "Skipping PRs for test-repo (repo not found)" in result.output
+    assert result.exit_code == 0
+    assert "Skipping PRs for test-repo (repo not found)" in result.output
 
 
 @patch("subprocess.run")
-def test_pull_handles_pr_fetch_failure(mock_run, tmp_path):
+def test_pull_handles_pr_fetch_failure(mock_run, runner, make_configs):
     """Test that pull handles failures when fetching a PR."""
-    runner = CliRunner()
-
-    with runner.isolated_filesystem(temp_dir=tmp_path):
-        # Create configs.json
-        configs = deepcopy(BASE_CONFIGS)
-        configs["repos"][0]["pull_requests"] = [999]
-        with open("configs.json", "w") as f:
-            json.dump(configs, f)
-
-        # Create existing repo directory with org level
-        Path("repos/test-org/test-repo").mkdir(parents=True)
-
-        # Simulate PR fetch failure
-        def mock_subprocess_run(cmd, **kwargs):
-            from unittest.mock import Mock
-
-            result = Mock()
-            # Mock git pull
-            if cmd == ["git", "pull"]:
-                return result
-            # Mock git branch --list
-            if cmd == ["git", "branch", "--list"]:
-                result.stdout = ""
-                return result
-            # Mock git fetch to fail
-            if "fetch" in cmd:
-                raise subprocess.CalledProcessError(1, ["git", "fetch"])
+    make_configs(
+        [{**BASE_REPO, "pull_requests": [999]}], existing=[TEST_REPO_PATH]
+    )
+
+    # Simulate PR fetch failure
+    def mock_subprocess_run(cmd, **kwargs):
+        from unittest.mock import Mock
+
+        result = Mock()
+        # Mock git pull
+        if cmd == ["git", "pull"]:
             return result
+        # Mock git branch --list
+        if cmd == ["git", "branch", "--list"]:
+            result.stdout = ""
+            return result
+        # Mock git fetch to fail
+        if "fetch" in cmd:
+            raise subprocess.CalledProcessError(1, ["git", "fetch"])
+        return result
 
-        mock_run.side_effect = mock_subprocess_run
+    mock_run.side_effect = mock_subprocess_run
 
-        result = runner.invoke(main, ["pull"])
+    result = runner.invoke(main, ["pull"])
 
-        assert result.exit_code == 0
-        assert "Failed to fetch PR #999" in result.output
-        assert "Done." in result.output
+    assert result.exit_code == 0
+    assert "Failed to fetch PR #999" in result.output
+    assert "Done." in result.output
 
 
 @patch("subprocess.run")
-def test_pull_skips_invalid_pr_numbers(mock_run, tmp_path):
+def test_pull_skips_invalid_pr_numbers(mock_run, runner, make_configs):
     """Test that pull skips invalid PR numbers (non-integers)."""
-    runner = CliRunner()
+    make_configs(
+        [{**BASE_REPO, "pull_requests": [123, "invalid", None, 456]}],
+        existing=[TEST_REPO_PATH],
+    )
 
-    with runner.isolated_filesystem(temp_dir=tmp_path):
-        # Create configs.json with invalid PR numbers
-        configs = deepcopy(BASE_CONFIGS)
-        configs["repos"][0]["pull_requests"] = [123, "invalid", None, 456]
-        with open("configs.json", "w") as f:
-            json.dump(configs, f)
-
-        # Create existing repo directory with org level
-        Path("repos/test-org/test-repo").mkdir(parents=True)
-
-        result = runner.invoke(main, ["pull"])
+    result = runner.invoke(main, ["pull"])
 
-        assert result.exit_code == 0
-        assert "Fetching PR #123" in result.output
-        assert "Fetching PR #456" in result.output
-        assert "Skipping invalid PR number" in result.output
+    assert result.exit_code == 0
+    assert "Fetching PR #123" in result.output
+    assert "Fetching PR #456" in result.output
+    assert "Skipping invalid PR number" in result.output
 
-        # Verify only valid PRs were fetched: 1 pull + 1 branch check + 2 fetch (123, 456)
-        assert mock_run.call_count == 4
+    # Verify only valid PRs were fetched: 1 pull + 1 branch check + 2 fetch (123, 456)
+    assert mock_run.call_count == 4
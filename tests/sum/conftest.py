@@ -0,0 +1,190 @@
+"""Shared fixtures for the sum command tests."""
+
+import importlib
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from crev import main
+
+# Import up front so the first invoke in a test doesn't pay for it.
+# crev.sum resolves to the click group, so look the module up by name.
+sum_pr = importlib.import_module("crev.sum.sum_pr")
+
+# Prompt files referenced by test.configs.json, pre-encoded
+PROMPT_FILES = {
+    "sum.repo.txt": b"Test repo prompt",
+    "sum.pr.txt": b"Test PR prompt",
+    "sum_repo_file_category.txt": b"Categorize files prompt",
+    "sum_repo_structure.txt": b"Structure prompt",
+    "sum_repo_app.txt": b"App prompt",
+    "sum_repo_test.txt": b"Test prompt",
+    "sum_repo_infra.txt": b"Infra prompt",
+}
+
+
+def setup_test_project(root, configs_bytes):
+    """Set up a test project with configs.json and prompts under root."""
+    # Write the shared test configs as-is
+    (root / "configs.json").write_bytes(configs_bytes)
+
+    # Create prompts directory and prompt files
+    prompts_dir = root / "prompts"
+    prompts_dir.mkdir()
+    for name, content in PROMPT_FILES.items():
+        (prompts_dir / name).write_bytes(content)
+
+    return root
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """Create a CliRunner shared by all sum tests."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_crev(runner):
+    """Run the CLI once so lazy imports aren't paid inside the first test."""
+    runner.invoke(main, ["--help"])
+
+
+@pytest.fixture(scope="session")
+def sum_help(runner):
+    """Invoke 'crev sum --help' once per session; the output never changes."""
+    return runner.invoke(main, ["sum", "--help"])
+
+
+@pytest.fixture(scope="session")
+def base_configs_bytes():
+    """Read the shared test configs.json once per session."""
+    return (Path(__file__).parent / "test.configs.json").read_bytes()
+
+
+@pytest.fixture(scope="session")
+def project_template(tmp_path_factory, base_configs_bytes):
+    """Build the test project tree once per session.
+
+    Under pytest-xdist each worker has its own session and basetemp, so every
+    worker builds its own template and no cross-process locking is needed.
+    Tests must not modify the template; use the project fixture instead.
+    """
+    root = tmp_path_factory.mktemp("project_template")
+    return setup_test_project(root, base_configs_bytes)
+
+
+def _link_or_copy(src, dst):
+    """Hardlink src to dst, falling back to a copy where links aren't supported."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+@pytest.fixture
+def project(project_template, tmp_path, monkeypatch):
+    """Link the project template into tmp_path and change into it.
+
+    Template files are hardlinked, so tests must not write to configs.json
+    or the prompt files in place.
+    """
+    shutil.copytree(
+        project_template, tmp_path, copy_function=_link_or_copy, dirs_exist_ok=True
+    )
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+class _Workspace:
+    """A linked-in test project plus a CLI entry point bound to it.
+
+    Paths are only computed, not created, since some tests need them to be
+    missing. repo_dir and output_dir point at test-org/test-repo, the repo
+    listed in test.configs.json.
+    """
+
+    def __init__(self, root, runner):
+        self.root = root
+        self.repos_dir = root / "repos"
+        self.data_dir = root / "data"
+        self.repo_dir = self.repos_dir / "test-org" / "test-repo"
+        self.output_dir = self.data_dir / "test-org" / "test-repo" / "sum"
+        self._runner = runner
+
+    def invoke(self, args, standalone_mode=False):
+        """Invoke the CLI, by default without click's standalone exit handling.
+
+        The sum repo commands report failures by echoing and raising
+        SystemExit, which CliRunner records the same way in either mode, so
+        those tests skip the standalone wrapper. Click usage errors and other
+        ClickExceptions are different: outside standalone mode they surface
+        as result.exception with no usage text in result.output. Pass
+        standalone_mode=True to check those the way test_sum_pr.py does.
+
+        Args:
+            args: Command line arguments, e.g. ["sum", "repo"]
+            standalone_mode: Whether click handles exits and usage errors
+
+        Returns:
+            The click.testing.Result of the invocation
+        """
+        return self._runner.invoke(main, args, standalone_mode=standalone_mode)
+
+
+@pytest.fixture
+def workspace(project, runner):
+    """Return the current test project together with a bound CLI invoker."""
+    return _Workspace(project, runner)
+
+
+class _Response:
+    """Stand-in for an LLM response message."""
+
+    content = "Test PR summary"
+
+
+class _Client:
+    """Stand-in LLM client whose invoke always returns the same response."""
+
+    def invoke(self, *args, **kwargs):
+        return _Response()
+
+
+@pytest.fixture
+def mock_llm(monkeypatch):
+    """Patch the sum pr LLM client with a stub that returns a fixed summary."""
+    client = _Client()
+    monkeypatch.setattr(sum_pr, "get_llm_client", lambda *a, **k: client)
+    return client
+
+
+def _make_pr_layout(pr_dir, diff="diff content"):
+    """Create a PR input directory with sum/diff.txt and an empty code dir."""
+    sum_dir = pr_dir / "sum"
+    sum_dir.mkdir(parents=True)
+    (sum_dir / "diff.txt").write_text(diff)
+    (pr_dir / "code").mkdir()
+    return pr_dir
+
+
+@pytest.fixture
+def make_pr_layout():
+    """Return a helper that creates a PR input directory layout."""
+    return _make_pr_layout
+
+
+@pytest.fixture
+def multi_pr(project):
+    """Return a helper that lays out several PRs of one repo under data/."""
+
+    def _make(org, repo, pr_nums):
+        for pr_num in pr_nums:
+            _make_pr_layout(
+                project / "data" / org / repo / str(pr_num),
+                diff=f"diff content for PR {pr_num}",
+            )
+
+    return _make
@@ -1,34 +1,42 @@
 """Tests for the sum command (general tests)."""
 
-from click.testing import CliRunner
+import os
 
 from crev import main
+from crev.sum.util import load_prompt_file
 
 
-def test_sum_command_exists():
+def test_sum_command_exists(runner):
     """Test that the sum command is registered."""
-    runner = CliRunner()
     result = runner.invoke(main, ["--help"])
 
     assert result.exit_code == 0
     assert "sum" in result.output
 
 
-def test_sum_command_shows_help():
+def test_sum_command_shows_help(sum_help):
     """Test that the sum command shows help text."""
-    runner = CliRunner()
-    result = runner.invoke(main, ["sum", "--help"])
-
-    assert result.exit_code == 0
-    assert "Summarize repositories and pull requests" in result.output
+    assert sum_help.exit_code == 0
+    assert "Summarize repositories and pull requests" in sum_help.output
 
 
-def test_sum_command_lists_subcommands():
+def test_sum_command_lists_subcommands(sum_help):
     """Test that the sum command lists its subcommands."""
-    runner = CliRunner()
-    result = runner.invoke(main, ["sum", "--help"])
-
-    assert result.exit_code == 0
+    assert sum_help.exit_code == 0
     # Check that both subcommands are listed
-    assert "repo" in result.output
-    assert "pr" in result.output
+    assert "repo" in sum_help.output
+    assert "pr" in sum_help.output
+
+
+def test_load_prompt_file_rereads_modified_file(tmp_path):
+    """Test that a cached prompt is re-read after the file changes."""
+    prompt_file = tmp_path / "prompt.txt"
+    prompt_file.write_text("First prompt")
+    assert load_prompt_file(str(prompt_file)) == "First prompt"
+
+    # Same size, so only the bumped mtime invalidates the cache
+    prompt_file.write_text("Other prompt")
+    stat = prompt_file.stat()
+    os.utime(prompt_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert load_prompt_file(str(prompt_file)) == "Other prompt"
@@ -1,492 +1,453 @@
 """Tests for the sum repo command."""
 
 import json
-from copy import deepcopy
-from pathlib import Path
-from unittest.mock import MagicMock, patch
+import re
+import threading
+from collections import namedtuple
+from unittest.mock import DEFAULT, patch
 
-from click.testing import CliRunner
+import pytest
 
 from crev import main
+from crev.utils import jsonio
 
-# Load base configs data from JSON file
-_TEST_CONFIGS_PATH = Path(__file__).parent / "test.configs.json"
-with _TEST_CONFIGS_PATH.open() as _f:
-    BASE_CONFIGS_DATA = json.load(_f)
 
+def _read_output(path):
+    """Read a file the command should have written, failing if it is missing."""
+    try:
+        return path.read_text()
+    except FileNotFoundError:
+        pytest.fail(f"expected output file was not created: {path}")
 
-def setup_test_project(tmp_path):
-    """Set up a test project with configs.json and prompts."""
-    # Create configs.json from base data
-    configs = deepcopy(BASE_CONFIGS_DATA)
 
-    configs_file = tmp_path / "configs.json"
-    with configs_file.open("w") as f:
-        json.dump(configs, f)
+def _ensure_dirs(*leaves):
+    """Create each leaf directory along with any missing parents."""
+    for leaf in leaves:
+        leaf.mkdir(parents=True, exist_ok=True)
 
-    # Create prompts directory
-    prompts_dir = tmp_path / "prompts"
-    prompts_dir.mkdir()
 
-    # Create prompt files
-    (prompts_dir / "sum.repo.txt").write_text("Test repo prompt")
-    (prompts_dir / "sum.pr.txt").write_text("Test PR prompt")
-    (prompts_dir / "sum_repo_file_category.txt").write_text("Categorize files prompt")
-    (prompts_dir / "sum_repo_structure.txt").write_text("Structure prompt")
-    (prompts_dir / "sum_repo_app.txt").write_text("App prompt")
-    (prompts_dir / "sum_repo_test.txt").write_text("Test prompt")
-    (prompts_dir / "sum_repo_infra.txt").write_text("Infra prompt")
+def _write_files(base, files):
+    """Write each name -> content entry of files under base as bytes."""
+    for name, content in files.items():
+        data = content if isinstance(content, bytes) else content.encode()
+        (base / name).write_bytes(data)
 
-    return tmp_path
 
+# Matches the error sum repo prints when repos/ is missing
+_REPOS_MISSING = re.compile(r"repos directory not found").search
 
-def test_sum_repo_subcommand_exists():
-    """Test that the sum repo subcommand is registered."""
-    runner = CliRunner()
-    result = runner.invoke(main, ["sum", "--help"])
+# Stand-in for an LLM response; sum repo only reads .content
+_Resp = namedtuple("_Resp", "content")
+
+
+class _ScriptedLLM:
+    """Stub LLM client that returns canned responses in call order."""
+
+    def __init__(self, responses):
+        self._responses = iter(responses)
+
+    def invoke(self, *args, **kwargs):
+        return next(self._responses)
+
+
+class _ConcurrentScriptedLLM:
+    """Stub LLM client that replays responses per thread and proves overlap.
+
+    Each worker thread gets its own copy of the script. The first call from
+    each thread waits on a barrier sized to the expected number of workers,
+    so the test only passes if that many repos reach the LLM at once.
+    """
+
+    def __init__(self, responses, workers):
+        self._responses = responses
+        self._barrier = threading.Barrier(workers, timeout=5)
+        self._local = threading.local()
+
+    def invoke(self, *args, **kwargs):
+        if not hasattr(self._local, "responses"):
+            self._local.responses = iter(self._responses)
+            self._barrier.wait()
+        return next(self._local.responses)
+
+
+# Mocked file categorization responses; the bytes form is also written as a
+# cached sum_repo.categorization.json in cache-hit tests
+_CAT_CACHE_BYTES = jsonio.dumps({"app": ["main.py"], "test": [], "infra": []})
+_CATEGORIZATION_JSON = _CAT_CACHE_BYTES.decode()
+_CATEGORIZATION_WITH_INFRA_JSON = jsonio.dumps(
+    {"app": ["main.py"], "test": [], "infra": ["README.md"]}
+).decode()
 
-    assert result.exit_code == 0
-    assert "repo" in result.output
 
+def _patch_pipeline():
+    """Patch git, the LLM client and the context collectors in sum_repo."""
+    return patch.multiple(
+        "crev.sum.sum_repo",
+        _get_git_version_info=DEFAULT,
+        get_llm_client=DEFAULT,
+        collect_file_category=DEFAULT,
+        collect_structure_context=DEFAULT,
+        collect_repo_context=DEFAULT,
+    )
 
-def test_sum_repo_requires_configs(tmp_path):
+
+def _configure_pipeline(mocks, llm):
+    """Give the patched pipeline fixed git info, collector output and llm."""
+    mocks["_get_git_version_info"].return_value = (10, "def4567890")
+    mocks["get_llm_client"].return_value = llm
+    mocks["collect_file_category"].return_value = "file listing context"
+    mocks["collect_structure_context"].return_value = "structure context"
+    mocks["collect_repo_context"].return_value = "repo context"
+
+
+def test_sum_repo_subcommand_exists(sum_help):
+    """Test that the sum repo subcommand is registered."""
+    assert sum_help.exit_code == 0
+    assert "repo" in sum_help.output
+
+
+def test_sum_repo_requires_configs(runner, tmp_path, monkeypatch):
     """Test that sum repo fails without configs.json."""
-    runner = CliRunner()
+    monkeypatch.chdir(tmp_path)
 
-    with runner.isolated_filesystem(temp_dir=tmp_path):
-        result = runner.invoke(main, ["sum", "repo"])
+    result = runner.invoke(main, ["sum", "repo"], standalone_mode=False)
 
-        assert result.exit_code != 0
-        assert "configs.json not found" in result.output
+    assert result.exit_code != 0
+    assert "configs.json not found" in result.output
 
 
-def test_sum_repo_checks_repos_directory(tmp_path):
+def test_sum_repo_checks_repos_directory(workspace):
     """Test that sum repo checks for repos directory."""
-    runner = CliRunner()
+    result = workspace.invoke(["sum", "repo"])
 
-    with runner.isolated_filesystem(temp_dir=tmp_path):
-        setup_test_project(Path.cwd())
+    assert result.exit_code != 0 or _REPOS_MISSING(result.output)
 
-        result = runner.invoke(main, ["sum", "repo"])
 
-        assert "repos directory not found" in result.output or result.exit_code != 0
+def test_sum_repo_with_specific_repo_name(workspace):
+    """Test that sum repo accepts a specific repo name."""
+    # Create the repo (with org level) and the data directory
+    repo_dir = workspace.repo_dir
+    _ensure_dirs(repo_dir, workspace.data_dir)
+
+    # Create a simple README in the repo
+    _write_files(repo_dir, {"README.md": "# Test Repo", "main.py": "print('hello')"})
+
+    # Mock the git commands, context collectors and LLM client
+    with _patch_pipeline() as mocks:
+        # LLM responses in call order: categorization, structure, app, infra
+        _configure_pipeline(
+            mocks,
+            _ScriptedLLM(
+                [
+                    _Resp(_CATEGORIZATION_WITH_INFRA_JSON),
+                    _Resp("Structure summary"),
+                    _Resp("App analysis"),
+                    _Resp("Infra analysis"),
+                ]
+            ),
+        )
+        mocks["_get_git_version_info"].return_value = (42, "abc1234567")
 
+        result = workspace.invoke(["sum", "repo", "test-org", "test-repo"])
 
-def test_sum_repo_with_specific_repo_name(tmp_path):
-    """Test that sum repo accepts a specific repo name."""
-    runner = CliRunner()
-
-    with runner.isolated_filesystem(temp_dir=tmp_path):
-        # Setup test project in the isolated filesystem
-        setup_test_project(Path.cwd())
-
-        # Create repos directory with a git repo (with org level)
-        repos_dir = Path("repos")
-        repos_dir.mkdir()
-        repo_dir = repos_dir / "test-org" / "test-repo"
-        repo_dir.mkdir(parents=True)
-
-        # Create a simple README in the repo
-        (repo_dir / "README.md").write_text("# Test Repo")
-        (repo_dir / "main.py").write_text("print('hello')")
-
-        # Create data directory
-        Path("data").mkdir()
-
-        # Mock the git commands and LLM client
-        with (
-            patch("crev.sum.sum_repo._get_git_version_info") as mock_git,
-            patch("crev.sum.sum_repo.get_llm_client") as mock_llm,
-            patch(
-                "crev.sum.sum_repo.collect_file_category"
-            ) as mock_collect_file_category,
-            patch(
-                "crev.sum.sum_repo.collect_structure_context"
-            ) as mock_collect_structure,
-            patch("crev.sum.sum_repo.collect_repo_context") as mock_collect_repo,
-        ):
-            mock_git.return_value = (42, "abc1234567")
-
-            # Set up LLM mock responses
-            mock_response = MagicMock()
-            mock_llm_instance = MagicMock()
-            mock_llm.return_value = mock_llm_instance
-
-            # Configure response for file categorization (returns JSON)
-            categorization_response = MagicMock()
-            categorization_response.content = json.dumps(
-                {"app": ["main.py"], "test": [], "infra": ["README.md"]}
-            )
-
-            # Configure responses for other LLM calls
-            structure_response = MagicMock()
-            structure_response.content = "Structure summary"
-
-            app_response = MagicMock()
-            app_response.content = "App analysis"
-
-            infra_response = MagicMock()
-            infra_response.content = "Infra analysis"
-
-            mock_llm_instance.invoke.side_effect = [
-                categorization_response,
-                structure_response,
-                app_response,
-                infra_response,
-            ]
-
-            # Set up context collector mocks
-            mock_collect_file_category.return_value = "file listing context"
-            mock_collect_structure.return_value = "structure context"
-            mock_collect_repo.return_value = "repo context"
-
-            result = runner.invoke(main, ["sum", "repo", "test-org", "test-repo"])
-
-            assert result.exit_code == 0
-            assert "Summarizing repository: test-org/test-repo" in result.output
-
-            # Check that output file was created in the new location (with org level)
-            output_dir = Path("data") / "test-org" / "test-repo" / "sum"
-            assert output_dir.exists()
-
-            # Check for output file with versioned name
-            output_file = output_dir / "sum.repo.42.abc1234567.ai.md"
-            assert output_file.exists()
-            content = output_file.read_text()
-            assert "Repository Summary: test-repo" in content
-
-
-def test_sum_repo_skips_existing_final_output(tmp_path):
+        assert result.exit_code == 0
+        assert "Summarizing repository: test-org/test-repo" in result.output
+
+        # Check for the versioned output file in the new location (with org level)
+        output = workspace.output_dir / "sum.repo.42.abc1234567.ai.md"
+        content = _read_output(output)
+        assert "Repository Summary: test-repo" in content
+
+
+def test_sum_repo_skips_existing_final_output(workspace):
     """Test that sum repo skips repos with existing final output files."""
-    runner = CliRunner()
+    # Create the repo (with org level) and data/test-org/test-repo/sum
+    repo_dir = workspace.repo_dir
+    output_dir = workspace.output_dir
+    _ensure_dirs(repo_dir, output_dir)
+    (repo_dir / "README.md").write_text("# Test Repo")
+
+    # Create existing output file
+    output_file = output_dir / "sum.repo.42.abc1234567.ai.md"
+    output_file.write_text("Existing summary")
+
+    # Mock the git commands
+    with patch("crev.sum.sum_repo._get_git_version_info") as mock_git:
+        mock_git.return_value = (42, "abc1234567")
+
+        result = workspace.invoke(["sum", "repo", "test-org", "test-repo"])
+
+        assert result.exit_code == 0
+        # Should skip because final output exists
+        assert "Loading cached result from:" in result.output
+
+
+# Two repos in separate orgs, used by the multi-repo tests
+_TWO_REPOS = [
+    {
+        "org": "org1",
+        "name": "repo1",
+        "url": "https://github.com/test/repo1.git",
+        "pull_requests": [],
+    },
+    {
+        "org": "org2",
+        "name": "repo2",
+        "url": "https://github.com/test/repo2.git",
+        "pull_requests": [],
+    },
+]
+
+# LLM calls each repo makes: categorization, structure, app (no infra files
+# are categorized)
+_REPO_RESPONSES = [
+    _Resp(_CATEGORIZATION_JSON),
+    _Resp("Structure summary"),
+    _Resp("App analysis"),
+]
+
+
+def _write_repos_config(workspace, base_configs_bytes, repos):
+    """Replace the repos listed in the workspace's configs.json."""
+    # Fresh parse of the base configs
+    configs = json.loads(base_configs_bytes)
+    configs["repos"] = repos
+
+    # Override configs.json with the variant; unlink first since the project
+    # copy is a hardlink to the shared template
+    configs_file = workspace.root / "configs.json"
+    configs_file.unlink()
+    configs_file.write_bytes(jsonio.dumps(configs))
+
+
+def _setup_two_repos(workspace, base_configs_bytes):
+    """Point configs.json at _TWO_REPOS and create both repos on disk."""
+    _write_repos_config(workspace, base_configs_bytes, _TWO_REPOS)
+
+    # Create both repos (with org level) and the data directory
+    repos_dir = workspace.repos_dir
+    _ensure_dirs(
+        repos_dir / "org1" / "repo1", repos_dir / "org2" / "repo2", workspace.data_dir
+    )
+    _write_files(
+        repos_dir, {"org1/repo1/main.py": "# repo1", "org2/repo2/main.py": "# repo2"}
+    )
+
+
+def test_sum_repo_rejects_invalid_jobs(workspace):
+    """Test that sum repo reports a usage error for --jobs below 1."""
+    result = workspace.invoke(["sum", "repo", "--jobs", "0"], standalone_mode=True)
+
+    assert result.exit_code == 2
+    assert "Invalid value for '--jobs'" in result.output
+
+
+def test_sum_repo_processes_all_repos(workspace, base_configs_bytes):
+    """Test that sum repo processes all repos when no repo name is specified."""
+    _setup_two_repos(workspace, base_configs_bytes)
 
-    with runner.isolated_filesystem(temp_dir=tmp_path):
-        # Setup test project in the isolated filesystem
-        setup_test_project(Path.cwd())
+    with _patch_pipeline() as mocks:
+        _configure_pipeline(mocks, _ScriptedLLM(_REPO_RESPONSES * len(_TWO_REPOS)))
 
-        # Create repos directory with git repo (with org level)
-        repos_dir = Path("repos")
-        repos_dir.mkdir()
-        repo_dir = repos_dir / "test-org" / "test-repo"
-        repo_dir.mkdir(parents=True)
-        (repo_dir / "README.md").write_text("# Test Repo")
+        result = workspace.invoke(["sum", "repo"])
 
-        # Create data/test-org/test-repo/sum directory and existing output file
-        output_dir = Path("data") / "test-org" / "test-repo" / "sum"
-        output_dir.mkdir(parents=True)
-        output_file = output_dir / "sum.repo.42.abc1234567.ai.md"
-        output_file.write_text("Existing summary")
+        assert result.exit_code == 0
+        assert "Summarizing repository: org1/repo1" in result.output
+        assert "Summarizing repository: org2/repo2" in result.output
 
-        # Mock the git commands
-        with patch("crev.sum.sum_repo._get_git_version_info") as mock_git:
-            mock_git.return_value = (42, "abc1234567")
 
-            result = runner.invoke(main, ["sum", "repo", "test-org", "test-repo"])
+def test_sum_repo_jobs_summarizes_repos_concurrently(workspace, base_configs_bytes):
+    """Test that sum repo --jobs overlaps the LLM calls of different repos."""
+    _setup_two_repos(workspace, base_configs_bytes)
 
-            assert result.exit_code == 0
-            # Should skip because final output exists
-            assert "Loading cached result from:" in result.output
+    with _patch_pipeline() as mocks:
+        # The stub's barrier breaks (failing the run) unless both repos are
+        # inside the LLM at the same time
+        _configure_pipeline(
+            mocks, _ConcurrentScriptedLLM(_REPO_RESPONSES, len(_TWO_REPOS))
+        )
 
+        result = workspace.invoke(["sum", "repo", "--jobs", "2"])
 
-def test_sum_repo_processes_all_repos(tmp_path):
-    """Test that sum repo processes all repos when no repo name is specified."""
-    runner = CliRunner()
+        assert result.exit_code == 0, result.exception
+        assert "Summarizing repository: org1/repo1" in result.output
+        assert "Summarizing repository: org2/repo2" in result.output
+        for org, name in (("org1", "repo1"), ("org2", "repo2")):
+            output = workspace.data_dir / org / name / "sum"
+            assert list(output.glob("sum.repo.*.ai.md"))
 
-    # Create configs with multiple repos (deep copy base and modify)
-    configs = deepcopy(BASE_CONFIGS_DATA)
-    configs["repos"] = [
+
+def test_sum_repo_jobs_stops_after_failure(workspace, base_configs_bytes):
+    """Test that sum repo --jobs starts no further repos once one has failed."""
+    repos = [
         {
             "org": "org1",
-            "name": "repo1",
-            "url": "https://github.com/test/repo1.git",
-            "pull_requests": [],
-        },
-        {
-            "org": "org2",
-            "name": "repo2",
-            "url": "https://github.com/test/repo2.git",
+            "name": f"repo{i}",
+            "url": f"https://github.com/test/repo{i}.git",
             "pull_requests": [],
-        },
+        }
+        for i in range(1, 5)
     ]
+    _write_repos_config(workspace, base_configs_bytes, repos)
+
+    started = []
+
+    def failing_summarize_repo(repo_name, *args):
+        # Every repo fails, so each worker's first repo fails before that
+        # worker can pick up another one
+        started.append(repo_name)
+        raise SystemExit(1)
+
+    with patch.multiple(
+        "crev.sum.sum_repo",
+        get_llm_client=DEFAULT,
+        summarize_repo=failing_summarize_repo,
+    ):
+        result = workspace.invoke(["sum", "repo", "--jobs", "2"])
+
+    assert result.exit_code == 1
+    # Only the repos handed to the two workers up front may have started
+    assert "repo1" in started
+    assert set(started) <= {"repo1", "repo2"}
 
-    with runner.isolated_filesystem(temp_dir=tmp_path):
-        # Use Path.cwd() to create files in the isolated filesystem
-        configs_file = Path("configs.json")
-        with configs_file.open("w") as f:
-            json.dump(configs, f)
-
-        # Create prompts directory
-        prompts_dir = Path("prompts")
-        prompts_dir.mkdir()
-        (prompts_dir / "sum.repo.txt").write_text("Test repo prompt")
-        (prompts_dir / "sum_repo_file_category.txt").write_text("Categorize prompt")
-        (prompts_dir / "sum_repo_structure.txt").write_text("Structure prompt")
-        (prompts_dir / "sum_repo_app.txt").write_text("App prompt")
-        (prompts_dir / "sum_repo_test.txt").write_text("Test prompt")
-        (prompts_dir / "sum_repo_infra.txt").write_text("Infra prompt")
-
-        # Create repos directory with org level
-        repos_dir = Path("repos")
-        repos_dir.mkdir()
-        (repos_dir / "org1" / "repo1").mkdir(parents=True)
-        (repos_dir / "org1" / "repo1" / "main.py").write_text("# repo1")
-        (repos_dir / "org2" / "repo2").mkdir(parents=True)
-        (repos_dir / "org2" / "repo2" / "main.py").write_text("# repo2")
-
-        # Create data directory
-        Path("data").mkdir()
-
-        # Mock the git commands and LLM client
-        with (
-            patch("crev.sum.sum_repo._get_git_version_info") as mock_git,
-            patch("crev.sum.sum_repo.get_llm_client") as mock_llm,
-            patch(
-                "crev.sum.sum_repo.collect_file_category"
-            ) as mock_collect_file_category,
-            patch(
-                "crev.sum.sum_repo.collect_structure_context"
-            ) as mock_collect_structure,
-            patch("crev.sum.sum_repo.collect_repo_context") as mock_collect_repo,
-        ):
-            mock_git.return_value = (10, "def4567890")
-
-            # Set up LLM mock
-            mock_llm_instance = MagicMock()
-            mock_llm.return_value = mock_llm_instance
-
-            # Configure responses for LLM calls (4 calls per repo: categorization, structure, app, infra)
-            categorization_response = MagicMock()
-            categorization_response.content = json.dumps(
-                {"app": ["main.py"], "test": [], "infra": []}
-            )
-
-            structure_response = MagicMock()
-            structure_response.content = "Structure summary"
-
-            app_response = MagicMock()
-            app_response.content = "App analysis"
-
-            # Each repo needs these responses
-            mock_llm_instance.invoke.side_effect = [
-                categorization_response,
-                structure_response,
-                app_response,
-                categorization_response,
-                structure_response,
-                app_response,
-            ]
-
-            # Set up context collector mocks
-            mock_collect_file_category.return_value = "file listing context"
-            mock_collect_structure.return_value = "structure context"
-            mock_collect_repo.return_value = "repo context"
-
-            result = runner.invoke(main, ["sum", "repo"])
-
-            assert result.exit_code == 0
-            assert "Summarizing repository: org1/repo1" in result.output
-            assert "Summarizing repository: org2/repo2" in result.output
-
-
-def test_sum_repo_context_only_flag(tmp_path):
+
+def test_sum_repo_context_only_flag(workspace):
     """Test that sum repo --context-only only collects context without LLM calls."""
-    runner = CliRunner()
-
-    with runner.isolated_filesystem(temp_dir=tmp_path):
-        # Setup test project in the isolated filesystem
-        setup_test_project(Path.cwd())
-
-        # Create repos directory with a git repo (with org level)
-        repos_dir = Path("repos")
-        repos_dir.mkdir()
-        repo_dir = repos_dir / "test-org" / "test-repo"
-        repo_dir.mkdir(parents=True)
-        (repo_dir / "README.md").write_text("# Test Repo")
-        (repo_dir / "main.py").write_text("print('hello')")
-
-        # Create data directory
-        Path("data").mkdir()
-
-        # Mock the git commands and context collector
-        with (
-            patch("crev.sum.sum_repo._get_git_version_info") as mock_git,
-            patch(
-                "crev.sum.sum_repo.collect_file_category"
-            ) as mock_collect_file_category,
-        ):
-            mock_git.return_value = (42, "abc1234567")
-            mock_collect_file_category.return_value = "file listing context"
-
-            result = runner.invoke(
-                main, ["sum", "repo", "test-org", "test-repo", "--context-only"]
-            )
-
-            assert result.exit_code == 0
-            assert "Context collection complete" in result.output
-
-            # Check that context file was created (with org level)
-            output_dir = Path("data") / "test-org" / "test-repo" / "sum"
-            context_file = output_dir / "sum_repo.categorization.context.md"
-            assert context_file.exists()
-
-
-def test_sum_repo_caches_intermediate_results(tmp_path):
-    """Test that sum repo caches intermediate results and loads from cache."""
-    runner = CliRunner()
-
-    with runner.isolated_filesystem(temp_dir=tmp_path):
-        # Setup test project in the isolated filesystem
-        setup_test_project(Path.cwd())
-
-        # Create repos directory with a git repo (with org level)
-        repos_dir = Path("repos")
-        repos_dir.mkdir()
-        repo_dir = repos_dir / "test-org" / "test-repo"
-        repo_dir.mkdir(parents=True)
-        (repo_dir / "README.md").write_text("# Test Repo")
-
-        # Create data directory with cached categorization result (with org level)
-        output_dir = Path("data") / "test-org" / "test-repo" / "sum"
-        output_dir.mkdir(parents=True)
-
-        # Create cached categorization context
-        categorization_context = output_dir / "sum_repo.categorization.context.md"
-        categorization_context.write_text("# Cached file listing")
-
-        # Create cached categorization result
-        categorization_result = output_dir / "sum_repo.categorization.json"
-        categorization_result.write_text(
-            json.dumps({"app": ["main.py"], "test": [], "infra": []})
+    # Create the repo (with org level) and the data directory
+    repo_dir = workspace.repo_dir
+    _ensure_dirs(repo_dir, workspace.data_dir)
+    _write_files(repo_dir, {"README.md": "# Test Repo", "main.py": "print('hello')"})
+
+    # Mock the git commands and context collector
+    with (
+        patch("crev.sum.sum_repo._get_git_version_info") as mock_git,
+        patch(
+            "crev.sum.sum_repo.collect_file_category"
+        ) as mock_collect_file_category,
+    ):
+        mock_git.return_value = (42, "abc1234567")
+        mock_collect_file_category.return_value = "file listing context"
+
+        result = workspace.invoke(
+            ["sum", "repo", "test-org", "test-repo", "--context-only"]
         )
 
-        # Mock the git commands and LLM client
-        with (
-            patch("crev.sum.sum_repo._get_git_version_info") as mock_git,
-            patch("crev.sum.sum_repo.get_llm_client") as mock_llm,
-            patch(
-                "crev.sum.sum_repo.collect_structure_context"
-            ) as mock_collect_structure,
-            patch("crev.sum.sum_repo.collect_repo_context") as mock_collect_repo,
-        ):
-            mock_git.return_value = (42, "abc1234567")
+        assert result.exit_code == 0
+        assert "Context collection complete" in result.output
 
-            # Set up LLM mock
-            mock_llm_instance = MagicMock()
-            mock_llm.return_value = mock_llm_instance
+        # Check that context file was created (with org level)
+        context_file = workspace.output_dir / "sum_repo.categorization.context.md"
+        assert context_file.exists()
 
-            # Only structure and app responses needed (categorization is cached)
-            structure_response = MagicMock()
-            structure_response.content = "Structure summary"
 
-            app_response = MagicMock()
-            app_response.content = "App analysis"
+@pytest.mark.parametrize("orjson_installed", [True, False], ids=["orjson", "stdlib"])
+def test_sum_repo_caches_intermediate_results(workspace, monkeypatch, orjson_installed):
+    """Test that sum repo caches intermediate results and loads from cache."""
+    if not orjson_installed:
+        # Parse the cached categorization with the stdlib json fallback
+        monkeypatch.setattr(jsonio, "orjson", None)
+
+    # Create the repo and a data directory for cached results (with org level)
+    repo_dir = workspace.repo_dir
+    output_dir = workspace.output_dir
+    _ensure_dirs(repo_dir, output_dir)
+    (repo_dir / "README.md").write_text("# Test Repo")
+
+    # Create cached categorization context and result
+    _write_files(
+        output_dir,
+        {
+            "sum_repo.categorization.context.md": "# Cached file listing",
+            "sum_repo.categorization.json": _CAT_CACHE_BYTES,
+        },
+    )
+
+    # Mock the git commands and LLM client
+    with patch.multiple(
+        "crev.sum.sum_repo",
+        _get_git_version_info=DEFAULT,
+        get_llm_client=DEFAULT,
+        collect_structure_context=DEFAULT,
+        collect_repo_context=DEFAULT,
+    ) as mocks:
+        mocks["_get_git_version_info"].return_value = (42, "abc1234567")
+
+        # Only structure and app responses needed (categorization is cached)
+        mocks["get_llm_client"].return_value = _ScriptedLLM(
+            [_Resp("Structure summary"), _Resp("App analysis")]
+        )
 
-            mock_llm_instance.invoke.side_effect = [
-                structure_response,
-                app_response,
-            ]
+        mocks["collect_structure_context"].return_value = "structure context"
+        mocks["collect_repo_context"].return_value = "repo context"
 
-            mock_collect_structure.return_value = "structure context"
-            mock_collect_repo.return_value = "repo context"
+        result = workspace.invoke(["sum", "repo", "test-org", "test-repo"])
 
-            result = runner.invoke(main, ["sum", "repo", "test-org", "test-repo"])
+        assert result.exit_code == 0
+        # Should load cached categorization
+        assert "Loading cached result from:" in result.output
 
-            assert result.exit_code == 0
-            # Should load cached categorization
-            assert "Loading cached result from:" in result.output
+        # The cached categorization listed main.py as app code
+        output = workspace.output_dir / "sum.repo.42.abc1234567.ai.md"
+        assert "App analysis" in _read_output(output)
 
 
-def test_sum_repo_repo_not_found(tmp_path):
+def test_sum_repo_repo_not_found(workspace):
     """Test that sum repo handles missing repo directory."""
-    runner = CliRunner()
+    # Create the org directory but not the repo
+    _ensure_dirs(workspace.repos_dir / "test-org")
 
-    with runner.isolated_filesystem(temp_dir=tmp_path):
-        setup_test_project(Path.cwd())
+    # Mock the git commands
+    with patch("crev.sum.sum_repo._get_git_version_info") as mock_git:
+        mock_git.return_value = (42, "abc1234567")
 
-        # Create repos directory but not the specific repo (with org level)
-        repos_dir = Path("repos")
-        repos_dir.mkdir()
-        # Create the org directory but not the repo
-        (repos_dir / "test-org").mkdir()
+        result = workspace.invoke(["sum", "repo", "test-org", "test-repo"])
 
-        # Mock the git commands
-        with patch("crev.sum.sum_repo._get_git_version_info") as mock_git:
-            mock_git.return_value = (42, "abc1234567")
+        assert "not found in repos directory" in result.output
 
-            result = runner.invoke(main, ["sum", "repo", "test-org", "test-repo"])
 
-            assert "not found in repos directory" in result.output
+def test_sum_repo_with_dot_wildcard(workspace):
+    """Test that sum repo accepts '.' as wildcard for all repos."""
+    # Create the repo (with org level) and the data directory
+    repo_dir = workspace.repo_dir
+    _ensure_dirs(repo_dir, workspace.data_dir)
+    _write_files(repo_dir, {"README.md": "# Test Repo", "main.py": "print('hello')"})
 
+    # Mock the git commands and context collector
+    with (
+        patch("crev.sum.sum_repo._get_git_version_info") as mock_git,
+        patch(
+            "crev.sum.sum_repo.collect_file_category"
+        ) as mock_collect_file_category,
+    ):
+        mock_git.return_value = (42, "abc1234567")
+        mock_collect_file_category.return_value = "file listing context"
 
-def test_sum_repo_with_dot_wildcard(tmp_path):
-    """Test that sum repo accepts '.' as wildcard for all repos."""
-    runner = CliRunner()
-
-    with runner.isolated_filesystem(temp_dir=tmp_path):
-        # Setup test project in the isolated filesystem
-        setup_test_project(Path.cwd())
-
-        # Create repos directory with a git repo (with org level)
-        repos_dir = Path("repos")
-        repos_dir.mkdir()
-        repo_dir = repos_dir / "test-org" / "test-repo"
-        repo_dir.mkdir(parents=True)
-        (repo_dir / "README.md").write_text("# Test Repo")
-        (repo_dir / "main.py").write_text("print('hello')")
-
-        # Create data directory
-        Path("data").mkdir()
-
-        # Mock the git commands and context collector
-        with (
-            patch("crev.sum.sum_repo._get_git_version_info") as mock_git,
-            patch(
-                "crev.sum.sum_repo.collect_file_category"
-            ) as mock_collect_file_category,
-        ):
-            mock_git.return_value = (42, "abc1234567")
-            mock_collect_file_category.return_value = "file listing context"
-
-            # Use "." to process all repos in test-org
-            result = runner.invoke(
-                main, ["sum", "repo", "test-org", ".", "--context-only"]
-            )
-
-            assert result.exit_code == 0
-            assert "Summarizing repository: test-org/test-repo" in result.output
-
-
-def test_sum_repo_with_org_only(tmp_path):
+        # Use "." to process all repos in test-org
+        result = workspace.invoke(["sum", "repo", "test-org", ".", "--context-only"])
+
+        assert result.exit_code == 0
+        assert "Summarizing repository: test-org/test-repo" in result.output
+
+
+def test_sum_repo_with_org_only(workspace):
     """Test that sum repo with only org processes all repos in that org."""
-    runner = CliRunner()
-
-    with runner.isolated_filesystem(temp_dir=tmp_path):
-        # Setup test project in the isolated filesystem
-        setup_test_project(Path.cwd())
-
-        # Create repos directory with a git repo (with org level)
-        repos_dir = Path("repos")
-        repos_dir.mkdir()
-        repo_dir = repos_dir / "test-org" / "test-repo"
-        repo_dir.mkdir(parents=True)
-        (repo_dir / "README.md").write_text("# Test Repo")
-        (repo_dir / "main.py").write_text("print('hello')")
-
-        # Create data directory
-        Path("data").mkdir()
-
-        # Mock the git commands and context collector
-        with (
-            patch("crev.sum.sum_repo._get_git_version_info") as mock_git,
-            patch(
-                "crev.sum.sum_repo.collect_file_category"
-            ) as mock_collect_file_category,
-        ):
-            mock_git.return_value = (42, "abc1234567")
-            mock_collect_file_category.return_value = "file listing context"
-
-            # Only specify org
-            result = runner.invoke(main, ["sum", "repo", "test-org", "--context-only"])
-
-            assert result.exit_code == 0
-            assert "Summarizing repository: test-org/test-repo" in result.output
+    # Create the repo (with org level) and the data directory
+    repo_dir = workspace.repo_dir
+    _ensure_dirs(repo_dir, workspace.data_dir)
+    _write_files(repo_dir, {"README.md": "# Test Repo", "main.py": "print('hello')"})
+
+    # Mock the git commands and context collector
+    with (
+        patch("crev.sum.sum_repo._get_git_version_info") as mock_git,
+        patch(
+            "crev.sum.sum_repo.collect_file_category"
+        ) as mock_collect_file_category,
+    ):
+        mock_git.return_value = (42, "abc1234567")
+        mock_collect_file_category.return_value = "file listing context"
+
+        # Only specify org
+        result = workspace.invoke(["sum", "repo", "test-org", "--context-only"])
+
+        assert result.exit_code == 0
+        assert "Summarizing repository: test-org/test-repo" in result.output